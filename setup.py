@@ -84,5 +84,6 @@ setuptools.setup(
             "mike",
         ],
         "text_embedding": ["sentence-transformers==2.*"],
+        "async": ["asyncpg==0.*", "greenlet"],
     },
 )
@@ -95,6 +95,8 @@ def clean_db(maybe_start_pg: None) -> Generator[str, None, None]:
     eng = create_engine(PYTEST_DB)
     with eng.begin() as connection:
         connection.execute(text("drop schema if exists vecs cascade;"))
+    # Dropping the schema invalidates any bootstrap recorded by earlier clients
+    vecs.Client.reset_bootstrap(PYTEST_DB)
     yield PYTEST_DB
     eng.dispose()
 
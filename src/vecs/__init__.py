@@ -1,14 +1,23 @@
+from typing import Any
+
 from vecs import exc
-from vecs.client import Client
+from vecs.client import AsyncClient, Client
 from vecs.collection import Collection, IndexMeasure, IndexMethod
 
 __project__ = "vecs"
 __version__ = "0.4.1"
 
 
-__all__ = ["IndexMethod", "IndexMeasure", "Collection", "Client", "exc"]
+__all__ = [
+    "IndexMethod",
+    "IndexMeasure",
+    "Collection",
+    "Client",
+    "AsyncClient",
+    "exc",
+]
 
 
-def create_client(connection_string: str) -> Client:
-    """Creates a client from a Postgres connection string"""
-    return Client(connection_string)
+def create_client(connection_string: str, **kwargs: Any) -> Client:
+    """Creates a client from a Postgres connection string. Keyword arguments are forwarded to `vecs.Client`"""
+    return Client(connection_string, **kwargs)
@@ -1,5 +1,5 @@
 """
-Defines the 'Client' class
+Defines the 'Client' and 'AsyncClient' classes
 
 Importing from the `vecs.client` directly is not supported.
 All public classes, enums, and functions are re-exported by the top level `vecs` module.
@@ -7,17 +7,33 @@ All public classes, enums, and functions are re-exported by the top level `vecs`
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+import asyncio
+import importlib
+import threading
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
 
 from deprecated import deprecated
-from sqlalchemy import MetaData, create_engine, text
+from sqlalchemy import URL, Connection, MetaData, create_engine, event, make_url, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
 
 from vecs.adapter import Adapter
-from vecs.exc import CollectionNotFound
-
-if TYPE_CHECKING:
-    from vecs.collection import Collection
+from vecs.collection import (
+    _COLLECTION_LOOKUP_SQL,
+    _COLLECTIONS_LOOKUP_SQL,
+    _EXECUTE_COLLECTION_LOOKUP_SQL,
+    _LIST_COLLECTIONS_SQL,
+    _PREPARE_COLLECTION_LOOKUP_SQL,
+    Collection,
+    build_drop_table,
+)
+from vecs.exc import (
+    ArgError,
+    CollectionNotFound,
+    MismatchedDimension,
+    MissingDependency,
+)
 
 
 class Client:
@@ -47,29 +63,167 @@ class Client:
         vx.disconnect()
     """
 
-    def __init__(self, connection_string: str):
+    # Maps connection urls, rendered without their password, that have already been
+    # bootstrapped by a `Client` in this process to the pgvector version reported at the time
+    _bootstrapped: ClassVar[Dict[str, str]] = {}
+    # Guards the dicts only and is never held across I/O
+    _bootstrap_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Serializes the bootstrap I/O of each connection url
+    _bootstrap_database_locks: ClassVar[Dict[str, threading.Lock]] = {}
+
+    def __init__(
+        self,
+        connection_string: str,
+        *,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        query_cache_size: int = 500,
+        disconnect_on_exit: bool = True,
+        warmup: int = 1,
+        prepare_statements: bool = False,
+    ):
         """
         Initialize a Client instance.
 
         Args:
             connection_string (str): A string representing the database connection information.
 
+        Keyword Args:
+            pool_size (int): The number of connections to keep open in the connection pool.
+            max_overflow (int): The number of connections that may be opened beyond *pool_size* under load.
+            pool_pre_ping (bool): Test connections for liveness when they are checked out of the pool. This costs an extra `select 1` round trip on every checkout; pass False to skip it when stale connections are handled by *pool_recycle* alone.
+            pool_recycle (int): Replace pooled connections older than this number of seconds. -1 disables recycling.
+            query_cache_size (int): The number of compiled SQL statements the engine keeps cached for reuse. 0 disables caching.
+            disconnect_on_exit (bool): Dispose of the connection pool when exiting a `with` block. Pass False when the client outlives the block, e.g. when embedded in a long running service, so the pool is reused.
+            warmup (int): The number of connections to open when the client is created so early queries don't wait on connection setup. Capped at *pool_size*.
+            prepare_statements (bool): Prepare frequently repeated catalog queries server side on each connection. Do not enable when connecting through a pooler in transaction mode (e.g. PgBouncer, or Supavisor on port 6543), which can't hold prepared statements across transactions.
+
         Returns:
             None
         """
-        self.engine = create_engine(connection_string)
+        self.engine = create_engine(
+            connection_string,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+            query_cache_size=query_cache_size,
+        )
+        self._collection_lookup_sql = _COLLECTION_LOOKUP_SQL
+        if prepare_statements:
+
+            @event.listens_for(self.engine, "connect")
+            def prepare_collection_lookup(dbapi_connection, connection_record):
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(_PREPARE_COLLECTION_LOOKUP_SQL)
+                dbapi_connection.commit()
+
+            self._collection_lookup_sql = _EXECUTE_COLLECTION_LOOKUP_SQL
+
+        self._disconnect_on_exit = disconnect_on_exit
         self.meta = MetaData(schema="vecs")
-        self.Session = sessionmaker(self.engine)
-
-        with self.Session() as sess:
-            with sess.begin():
-                sess.execute(text("create schema if not exists vecs;"))
-                sess.execute(text("create extension if not exists vector;"))
-                self.vector_version: str = sess.execute(
-                    text(
-                        "select installed_version from pg_available_extensions where name = 'vector' limit 1;"
-                    )
-                ).scalar_one()
+        # Sessions only run core statements, so there are no ORM objects to expire or flush
+        self.Session = sessionmaker(
+            self.engine, expire_on_commit=False, autoflush=False
+        )
+        # Collections known to exist, keyed on name, along with the adapter argument
+        # they were resolved with by get_or_create_collection
+        self._collection_cache: Dict[str, Tuple[Collection, Optional[Adapter]]] = {}
+
+        # Open the warmup connections first so they're already in the pool when they're
+        # first needed. Fresh connections aren't pinged on checkout so the bootstrap runs
+        # on one of them rather than checking a pooled connection back out. Connections
+        # beyond pool_size would be closed on return rather than kept
+        warm_connections: List[Connection] = []
+        try:
+            for _ in range(min(warmup, pool_size)):
+                warm_connections.append(self.engine.connect())
+
+            # The schema and extension only need to be created once per database so
+            # skip the bootstrap transaction if another client already ran it
+            bootstrap_key = Client._bootstrap_key(self.engine.url)
+            with Client._bootstrap_lock:
+                vector_version = Client._bootstrapped.get(bootstrap_key)
+                database_lock = Client._bootstrap_database_locks.setdefault(
+                    bootstrap_key, threading.Lock()
+                )
+
+            if vector_version is None:
+                # Concurrent bootstraps of the same database can fail so they're
+                # serialized, but on a lock of its own so a slow or unreachable
+                # database doesn't block clients of other databases
+                with database_lock:
+                    with Client._bootstrap_lock:
+                        vector_version = Client._bootstrapped.get(bootstrap_key)
+                    if vector_version is None:
+                        if warm_connections:
+                            vector_version = Client._bootstrap_database(
+                                warm_connections[0]
+                            )
+                        else:
+                            with self.engine.connect() as conn:
+                                vector_version = Client._bootstrap_database(conn)
+                        with Client._bootstrap_lock:
+                            Client._bootstrapped[bootstrap_key] = vector_version
+        finally:
+            for connection in warm_connections:
+                connection.close()
+        self.vector_version: str = vector_version
+
+    @staticmethod
+    def _bootstrap_database(conn: Connection) -> str:
+        """
+        PRIVATE
+
+        Creates the schema and extension, if they don't exist, and reads the pgvector
+        version in a single round trip. The result is that of the final statement.
+
+        Returns:
+            str: The installed pgvector version.
+        """
+        with conn.begin():
+            return conn.execute(
+                text(
+                    """
+                create schema if not exists vecs;
+                create extension if not exists vector;
+                select installed_version from pg_available_extensions where name = 'vector' limit 1;
+                """
+                )
+            ).scalar_one()
+
+    @staticmethod
+    def _bootstrap_key(connection_string: Union[str, URL]) -> str:
+        """
+        PRIVATE
+
+        Returns the key a connection string's bootstrap is recorded under. The user,
+        host, port, database and options are kept but the password is not.
+        """
+        return make_url(connection_string).render_as_string(hide_password=True)
+
+    @classmethod
+    def reset_bootstrap(cls, connection_string: Optional[str] = None) -> None:
+        """
+        Forget that a database has been bootstrapped so the next `Client` created for it
+        recreates the `vecs` schema and `vector` extension if they are missing.
+
+        Use when the `vecs` schema has been dropped outside of vecs.
+
+        Args:
+            connection_string (Optional[str]): The connection string of the database to forget. Forgets all databases when omitted.
+
+        Returns:
+            None
+        """
+        with cls._bootstrap_lock:
+            if connection_string is None:
+                cls._bootstrapped.clear()
+            else:
+                cls._bootstrapped.pop(cls._bootstrap_key(connection_string), None)
+        return
 
     def _supports_hnsw(self):
         return (
@@ -80,6 +234,46 @@ class Client:
             and not self.vector_version.startswith("0.0")
         )
 
+    def _cached_collection(
+        self,
+        name: str,
+        *,
+        dimension: Optional[int] = None,
+        adapter: Optional[Adapter] = None,
+    ) -> Optional[Collection]:
+        """
+        PRIVATE
+
+        Resolves a collection from the collection cache without a database round trip.
+
+        Returns:
+            Optional[Collection]: The collection, or None if it can't be resolved from the cache.
+
+        Raises:
+            MismatchedDimension: If the requested dimension does not match the cached collection.
+        """
+        adapter_dimension = adapter.exported_dimension if adapter else None
+
+        # A collection this client has already resolved is known to exist, so when
+        # a dimension is available it can be validated without a database round trip
+        cached = self._collection_cache.get(name)
+        if cached is None or (dimension or adapter_dimension) is None:
+            return None
+
+        cached_collection, cached_adapter = cached
+        if cached_collection.dimension != (dimension or adapter_dimension):
+            raise MismatchedDimension(
+                "Dimensions reported by adapter, dimension, and existing collection do not match"
+            )
+        if adapter is cached_adapter:
+            return cached_collection
+        return Collection(
+            name=name,
+            dimension=dimension or adapter_dimension,  # type: ignore
+            client=self,
+            adapter=adapter,
+        )
+
     def get_or_create_collection(
         self,
         name: str,
@@ -104,7 +298,9 @@ class Client:
         Raises:
             CollectionAlreadyExists: If a collection with the same name already exists
         """
-        from vecs.collection import Collection
+        cached = self._cached_collection(name, dimension=dimension, adapter=adapter)
+        if cached is not None:
+            return cached
 
         adapter_dimension = adapter.exported_dimension if adapter else None
 
@@ -115,7 +311,93 @@ class Client:
             adapter=adapter,
         )
 
-        return collection._create_if_not_exists()
+        collection._create_if_not_exists()
+        self._collection_cache[name] = (collection, adapter)
+        return collection
+
+    def get_or_create_collections(
+        self, specs: List[Tuple[str, int]]
+    ) -> List[Collection]:
+        """
+        Get many vector collections by name, creating any that don't exist.
+
+        All collections are looked up with a single query and any missing collections are
+        created together in a single transaction, so bootstrapping many collections costs
+        the same number of round trips as bootstrapping one.
+
+        Args:
+            specs (List[Tuple[str, int]]): The name and dimension of each collection.
+
+        Returns:
+            List[Collection]: The found or created collections, in the order of *specs*.
+
+        Raises:
+            MismatchedDimension: If a dimension does not match an existing collection's, or
+                the same name is requested with different dimensions. No collections are
+                created when raised.
+        """
+        collections: List[Optional[Collection]] = [
+            self._cached_collection(name, dimension=dimension)
+            for name, dimension in specs
+        ]
+        uncached = [
+            (ix, name, dimension)
+            for ix, (name, dimension) in enumerate(specs)
+            if collections[ix] is None
+        ]
+
+        if uncached:
+            with self.engine.begin() as conn:
+                existing = dict(
+                    conn.execute(
+                        _COLLECTIONS_LOOKUP_SQL,
+                        {"names": list({name for _, name, _ in uncached})},
+                    ).all()
+                )
+
+                # Duplicate names in specs resolve to the same collection
+                resolved: Dict[str, Collection] = {}
+                missing: Dict[str, Collection] = {}
+                for ix, name, dimension in uncached:
+                    if name not in resolved:
+                        resolved[name] = Collection(name, dimension, self)
+                        if name not in existing:
+                            missing[name] = resolved[name]
+                    if dimension != existing.get(name, resolved[name].dimension):
+                        raise MismatchedDimension(
+                            "Dimensions reported by adapter, dimension, and existing collection do not match"
+                        )
+                    collections[ix] = resolved[name]
+
+                if missing:
+                    # Create the missing tables and read back the dimensions of the tables
+                    # that now exist in the same round trip, in case another process
+                    # created one of them first
+                    lookup = _COLLECTIONS_LOOKUP_SQL.compile(
+                        dialect=self.engine.dialect
+                    )
+                    created = dict(
+                        conn.exec_driver_sql(
+                            ";".join(
+                                [
+                                    collection._create_table_sql()
+                                    for collection in missing.values()
+                                ]
+                                + [str(lookup)]
+                            ),
+                            {"names": list(missing)},
+                        ).all()
+                    )
+                    for name, collection in missing.items():
+                        if name in created and created[name] != collection.dimension:
+                            raise MismatchedDimension(
+                                "Dimensions reported by adapter, dimension, and existing collection do not match"
+                            )
+
+            for name, collection in resolved.items():
+                self._collection_cache.setdefault(name, (collection, None))
+
+        return collections  # type: ignore
 
     @deprecated("use Client.get_or_create_collection")
     def create_collection(self, name: str, dimension: int) -> Collection:
@@ -132,8 +414,6 @@ class Client:
         Raises:
             CollectionAlreadyExists: If a collection with the same name already exists
         """
-        from vecs.collection import Collection
-
         return Collection(name, dimension, self)._create()
 
     @deprecated("use Client.get_or_create_collection")
@@ -150,37 +430,19 @@ class Client:
         Raises:
             CollectionNotFound: If no collection with the given name exists.
         """
-        from vecs.collection import Collection
-
-        query = text(
-            f"""
-        select
-            relname as table_name,
-            atttypmod as embedding_dim
-        from
-            pg_class pc
-            join pg_attribute pa
-                on pc.oid = pa.attrelid
-        where
-            pc.relnamespace = 'vecs'::regnamespace
-            and pc.relkind = 'r'
-            and pa.attname = 'vec'
-            and not pc.relname ^@ '_'
-            and pc.relname = :name
-        """
-        ).bindparams(name=name)
-        with self.Session() as sess:
-            query_result = sess.execute(query).fetchone()
-
-            if query_result is None:
-                raise CollectionNotFound("No collection found with requested name")
-
-            name, dimension = query_result
-            return Collection(
-                name,
-                dimension,
-                self,
-            )
+        with self.engine.connect() as conn:
+            dimension = conn.execute(
+                self._collection_lookup_sql, {"name": name}
+            ).scalar_one_or_none()
+
+        if dimension is None:
+            raise CollectionNotFound("No collection found with requested name")
+
+        return Collection(
+            name,
+            dimension,
+            self,
+        )
 
     def list_collections(self) -> List["Collection"]:
         """
@@ -189,8 +451,6 @@ class Client:
         Returns:
             list[Collection]: A list of all collections.
         """
-        from vecs.collection import Collection
-
         return Collection._list_collections(self)
 
     def delete_collection(self, name: str) -> None:
@@ -205,9 +465,27 @@ class Client:
         Returns:
             None
         """
-        from vecs.collection import Collection
+        with self.engine.begin() as conn:
+            conn.execute(build_drop_table(name))
+        self.invalidate_collection_cache(name)
+        return
+
+    def invalidate_collection_cache(self, name: Optional[str] = None) -> None:
+        """
+        Forget collections cached by `get_or_create_collection`.
+
+        Use when a collection has been dropped or recreated outside of this client.
 
-        Collection(name, -1, self)._drop()
+        Args:
+            name (Optional[str]): The name of the collection to forget. Forgets all collections when omitted.
+
+        Returns:
+            None
+        """
+        if name is None:
+            self._collection_cache.clear()
+        else:
+            self._collection_cache.pop(name, None)
         return
 
     def disconnect(self) -> None:
@@ -232,7 +510,399 @@ class Client:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Disconnect the client on exiting the 'with' statement context.
+        Disconnect the client on exiting the 'with' statement context, unless the
+        client was created with `disconnect_on_exit=False`.
+
+        Args:
+            exc_type: The exception type, if any.
+            exc_val: The exception value, if any.
+            exc_tb: The traceback, if any.
+
+        Returns:
+            None
+        """
+        if self._disconnect_on_exit:
+            self.disconnect()
+        return
+
+
+# libpq connection string options that asyncpg.connect doesn't accept under the same name.
+# sqlalchemy's asyncpg dialect forwards url query options to asyncpg.connect as-is
+_LIBPQ_ONLY_QUERY_OPTIONS = {
+    "sslcert",
+    "sslkey",
+    "sslpassword",
+    "sslrootcert",
+    "sslcrl",
+    "sslcompression",
+    "gssencmode",
+    "channel_binding",
+    "options",
+    "keepalives",
+    "keepalives_idle",
+    "keepalives_interval",
+    "keepalives_count",
+}
+
+
+def _asyncpg_url(
+    connection_string: str, *, prepare_statements: bool = False
+) -> Tuple[URL, Dict[str, Any]]:
+    """
+    PRIVATE
+
+    Converts a libpq style connection string into an asyncpg url and the `connect_args`
+    required to carry over the libpq query options that asyncpg names differently.
+
+    Args:
+        connection_string (str): A string representing the database connection information.
+
+    Keyword Args:
+        prepare_statements (bool): Keep asyncpg's and sqlalchemy's named prepared statement caches. When False they are disabled so the client works through a pooler in transaction mode.
+
+    Returns:
+        Tuple[URL, Dict[str, Any]]: The asyncpg url and connect_args.
+
+    Raises:
+        ArgError: If the connection string includes a query option asyncpg doesn't support.
+    """
+    url = make_url(connection_string)
+    connect_args: Dict[str, Any] = {}
+
+    if "sslmode" in url.query:
+        # asyncpg accepts libpq's sslmode values for its ssl argument
+        connect_args["ssl"] = url.query["sslmode"]
+    if "connect_timeout" in url.query:
+        connect_args["timeout"] = float(url.query["connect_timeout"])  # type: ignore
+    if "application_name" in url.query:
+        connect_args["server_settings"] = {
+            "application_name": url.query["application_name"]
+        }
+
+    unsupported = sorted(_LIBPQ_ONLY_QUERY_OPTIONS.intersection(url.query))
+    if unsupported:
+        raise ArgError(
+            f"Connection string options not supported by AsyncClient: {', '.join(unsupported)}"
+        )
+
+    url = url.difference_update_query(
+        ["sslmode", "connect_timeout", "application_name"]
+    ).set(drivername="postgresql+asyncpg")
+
+    if not prepare_statements:
+        # asyncpg and sqlalchemy's asyncpg dialect both cache named prepared statements,
+        # which a pooler in transaction mode can't hold across transactions. Statements
+        # that are still prepared get unique names so they can't collide on a shared backend
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__vecs_{uuid4()}__"
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+    return url, connect_args
+
+
+class AsyncClient:
+    """
+    The `vecs.AsyncClient` class is an asyncio counterpart to `vecs.Client` for managing collections.
+    Creating, retrieving, listing and deleting collections are coroutines that run on an
+    [asyncpg](https://github.com/MagicStack/asyncpg) connection pool, so many collection operations can
+    be awaited concurrently without blocking the event loop.
+
+    The collections it returns are regular `vecs.Collection` instances. Their record methods
+    (upsert, fetch, query, etc) remain synchronous and run on a `vecs.Client` owned by the `AsyncClient`,
+    which keeps its own small connection pool sized by *sync_pool_size*.
+
+    Requires the `vecs[async]` extra.
+
+    Example usage:
+
+        DB_CONNECTION = "postgresql://<user>:<password>@<host>:<port>/<db_name>"
+
+        async with vecs.AsyncClient(DB_CONNECTION) as vx:
+            docs = await vx.get_or_create_collection(name="docs", dimension=3)
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        *,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        sync_pool_size: int = 2,
+        prepare_statements: bool = False,
+    ):
+        """
+        Initialize an AsyncClient instance. No connections are opened until the first operation is awaited.
+
+        Args:
+            connection_string (str): A string representing the database connection information.
+
+        Keyword Args:
+            pool_size (int): The number of connections to keep open in the asyncpg connection pool.
+            max_overflow (int): The number of connections that may be opened beyond *pool_size* under load.
+            pool_pre_ping (bool): Test connections for liveness when they are checked out of the pool. This costs an extra `select 1` round trip on every checkout; pass False to skip it when stale connections are handled by *pool_recycle* alone.
+            pool_recycle (int): Replace pooled connections older than this number of seconds. -1 disables recycling.
+            sync_pool_size (int): The size of the separate connection pool used by the synchronous record methods of returned collections. It has no overflow, so at most *pool_size* + *max_overflow* + *sync_pool_size* connections are opened.
+            prepare_statements (bool): Prepare and cache statements server side, on both the asyncpg pool and the `vecs.Client` that returned collections are bound to. Do not enable when connecting through a pooler in transaction mode (e.g. PgBouncer, or Supavisor on port 6543), which can't hold prepared statements across transactions.
+
+        Returns:
+            None
+
+        The libpq `sslmode`, `connect_timeout` and `application_name` connection string options
+        are translated for asyncpg. Other libpq-only options, e.g. `sslrootcert`, are not supported.
+
+        Raises:
+            ArgError: If the connection string includes an option asyncpg doesn't support.
+            MissingDependency: If the asyncpg or greenlet libraries are not installed.
+        """
+        try:
+            # sqlalchemy only reports a missing greenlet at the first await, so both
+            # drivers are imported up front
+            for module in ("asyncpg", "greenlet"):
+                importlib.import_module(module)
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            url, connect_args = _asyncpg_url(
+                connection_string, prepare_statements=prepare_statements
+            )
+            self.engine = create_async_engine(
+                url,
+                connect_args=connect_args,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=pool_pre_ping,
+                pool_recycle=pool_recycle,
+            )
+        except ImportError:
+            raise MissingDependency(
+                "Missing feature vecs[async]. Hint: `pip install 'vecs[async]'`"
+            )
+
+        self._connection_string = connection_string
+        # The sync client only serves collection record methods so its pool is sized separately
+        self._sync_pool_options = dict(
+            pool_size=sync_pool_size,
+            max_overflow=0,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+        )
+        self._prepare_statements = prepare_statements
+        self._client: Optional[Client] = None
+        # Serializes the bootstrap so concurrent first operations share one client.
+        # Created on first use because on python < 3.10 a lock binds to the event
+        # loop current at creation, which may not be the loop the client runs on
+        self._client_lock: Optional[asyncio.Lock] = None
+
+    async def _get_client(self) -> Client:
+        """
+        PRIVATE
+
+        Bootstraps the database, if required, and returns the synchronous client that
+        collections returned by this instance are bound to.
+
+        Returns:
+            Client: The synchronous client.
+        """
+        if self._client is not None:
+            return self._client
+
+        # Nothing is awaited between the check and the assignment so only one lock is created
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+
+        async with self._client_lock:
+            if self._client is None:
+                self._client = await self._bootstrap()
+        return self._client
+
+    async def _bootstrap(self) -> Client:
+        """
+        PRIVATE
+
+        Creates the schema and extension, if they have not been recorded as bootstrapped,
+        and builds the synchronous client. Callers must hold `_client_lock`.
+
+        Returns:
+            Client: The synchronous client.
+        """
+        bootstrap_key = Client._bootstrap_key(self._connection_string)
+        with Client._bootstrap_lock:
+            bootstrapped = bootstrap_key in Client._bootstrapped
+
+        # Waiting on the per database lock `Client` bootstraps under would block the
+        # event loop, so this bootstrap isn't serialized with those of other clients.
+        # The statements are idempotent and the first recorded version is kept
+        if not bootstrapped:
+            # asyncpg prepares every statement so they can't be sent as one string
+            async with self.engine.begin() as conn:
+                await conn.execute(text("create schema if not exists vecs;"))
+                await conn.execute(text("create extension if not exists vector;"))
+                vector_version = (
+                    await conn.execute(
+                        text(
+                            "select installed_version from pg_available_extensions where name = 'vector' limit 1;"
+                        )
+                    )
+                ).scalar_one()
+            with Client._bootstrap_lock:
+                Client._bootstrapped.setdefault(bootstrap_key, vector_version)
+
+        # The bootstrap is recorded so constructing the client does no I/O
+        return Client(
+            self._connection_string,
+            warmup=0,
+            prepare_statements=self._prepare_statements,
+            **self._sync_pool_options,
+        )
+
+    async def get_or_create_collection(
+        self,
+        name: str,
+        *,
+        dimension: Optional[int] = None,
+        adapter: Optional[Adapter] = None,
+    ) -> Collection:
+        """
+        Get a vector collection by name, or create it if no collection with
+        *name* exists.
+
+        Args:
+            name (str): The name of the collection.
+
+        Keyword Args:
+            dimension (int): The dimensionality of the vectors in the collection.
+            adapter (Adapter): The adapter to use for the collection.
+
+        Returns:
+            Collection: The found or created collection.
+
+        Raises:
+            MismatchedDimension: If the dimension does not match the existing collection's.
+        """
+        client = await self._get_client()
+
+        cached = client._cached_collection(name, dimension=dimension, adapter=adapter)
+        if cached is not None:
+            return cached
+
+        adapter_dimension = adapter.exported_dimension if adapter else None
+
+        collection = Collection(
+            name=name,
+            dimension=dimension or adapter_dimension,  # type: ignore
+            client=client,
+            adapter=adapter,
+        )
+
+        async with self.engine.begin() as conn:
+            # Only send DDL, which requires create privileges on the schema, when
+            # the collection doesn't already exist
+            collection_dimension = (
+                await conn.execute(_COLLECTION_LOOKUP_SQL, {"name": name})
+            ).scalar_one_or_none()
+
+            if collection_dimension is None:
+                await conn.execute(CreateTable(collection.table, if_not_exists=True))
+                collection_dimension = (
+                    await conn.execute(_COLLECTION_LOOKUP_SQL, {"name": name})
+                ).scalar_one_or_none()
+
+        if (
+            collection_dimension is not None
+            and collection_dimension != collection.dimension
+        ):
+            raise MismatchedDimension(
+                "Dimensions reported by adapter, dimension, and existing collection do not match"
+            )
+
+        client._collection_cache[name] = (collection, adapter)
+        return collection
+
+    async def get_collection(self, name: str) -> Collection:
+        """
+        Retrieve an existing vector collection.
+
+        Args:
+            name (str): The name of the collection.
+
+        Returns:
+            Collection: The retrieved collection.
+
+        Raises:
+            CollectionNotFound: If no collection with the given name exists.
+        """
+        client = await self._get_client()
+
+        async with self.engine.connect() as conn:
+            dimension = (
+                await conn.execute(_COLLECTION_LOOKUP_SQL, {"name": name})
+            ).scalar_one_or_none()
+
+        if dimension is None:
+            raise CollectionNotFound("No collection found with requested name")
+
+        return Collection(
+            name,
+            dimension,
+            client,
+        )
+
+    async def list_collections(self) -> List["Collection"]:
+        """
+        List all vector collections.
+
+        Returns:
+            list[Collection]: A list of all collections.
+        """
+        client = await self._get_client()
+
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(_LIST_COLLECTIONS_SQL)).all()
+        return [Collection(name, dimension, client) for name, dimension in rows]
+
+    async def delete_collection(self, name: str) -> None:
+        """
+        Delete a vector collection.
+
+        If no collection with requested name exists, does nothing.
+
+        Args:
+            name (str): The name of the collection.
+
+        Returns:
+            None
+        """
+        client = await self._get_client()
+
+        async with self.engine.begin() as conn:
+            await conn.execute(build_drop_table(name))
+        client.invalidate_collection_cache(name)
+        return
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect the client from the database.
+
+        Returns:
+            None
+        """
+        await self.engine.dispose()
+        if self._client is not None:
+            self._client.disconnect()
+        return
+
+    async def __aenter__(self) -> "AsyncClient":
+        """
+        Enable use of the 'async with' statement.
+
+        Returns:
+            AsyncClient: The current instance of the AsyncClient.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Disconnect the client on exiting the 'async with' statement context.
 
         Args:
             exc_type: The exception type, if any.
@@ -242,5 +912,5 @@ class Client:
         Returns:
             None
         """
-        self.disconnect()
+        await self.disconnect()
         return
@@ -28,6 +28,7 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import DropTable
 
 from vecs.adapter import Adapter, AdapterContext, NoOp
 from vecs.exc import (
@@ -48,6 +49,72 @@ Metadata = Dict[str, MetadataValues]
 Numeric = Union[int, float, complex]
 Record = Tuple[str, Iterable[Numeric], Metadata]
 
+# Looks up a collection's embedding dimension by name. Built once at
+# import time so every lookup reuses the same statement (and its cached compiled form).
+# Resolving the table with to_regclass turns the catalog join into lookups by oid.
+# to_regclass returns null, and so no rows, when the table does not exist
+_COLLECTION_LOOKUP_SQL = text(
+    """
+select
+    atttypmod as embedding_dim
+from
+    pg_attribute pa
+    join pg_class pc
+        on pc.oid = pa.attrelid
+where
+    pa.attrelid = to_regclass('vecs.' || quote_ident(:name))
+    and pa.attname = 'vec'
+    and pc.relkind = 'r'
+    and not pc.relname ^@ '_'
+"""
+)
+
+# Server-side prepared form of the collection lookup. `vecs.Client` prepares it on each
+# new connection so Postgres parses and plans it once per connection rather than once per
+# lookup. It only reads catalogs by oid so the generic plan is always appropriate
+_PREPARE_COLLECTION_LOOKUP_SQL = (
+    "prepare vecs_collection_lookup(text) as "
+    + _COLLECTION_LOOKUP_SQL.text.replace(":name", "$1")
+)
+_EXECUTE_COLLECTION_LOOKUP_SQL = text("execute vecs_collection_lookup(:name)")
+
+# Looks up the name and embedding dimension of each collection in a list of names
+_COLLECTIONS_LOOKUP_SQL = text(
+    """
+select
+    relname as table_name,
+    atttypmod as embedding_dim
+from
+    pg_class pc
+    join pg_attribute pa
+        on pc.oid = pa.attrelid
+where
+    pc.relnamespace = 'vecs'::regnamespace
+    and pc.relkind = 'r'
+    and pa.attname = 'vec'
+    and not pc.relname ^@ '_'
+    and pc.relname = any(:names)
+"""
+)
+
+# Lists the name and embedding dimension of every collection
+_LIST_COLLECTIONS_SQL = text(
+    """
+select
+    relname as table_name,
+    atttypmod as embedding_dim
+from
+    pg_class pc
+    join pg_attribute pa
+        on pc.oid = pa.attrelid
+where
+    pc.relnamespace = 'vecs'::regnamespace
+    and pc.relkind = 'r'
+    and pa.attname = 'vec'
+    and not pc.relname ^@ '_'
+"""
+)
+
 
 class IndexMethod(str, Enum):
     """
@@ -143,19 +210,14 @@ class Collection:
         self._index: Optional[str] = None
         self.adapter = adapter or Adapter(steps=[NoOp(dimension=dimension)])
 
-        reported_dimensions = set(
-            [
-                x
-                for x in [
-                    dimension,
-                    adapter.exported_dimension if adapter else None,
-                ]
-                if x is not None
-            ]
-        )
-        if len(reported_dimensions) == 0:
+        adapter_dimension = adapter.exported_dimension if adapter else None
+        if dimension is None and adapter_dimension is None:
             raise ArgError("One of dimension or adapter must provide a dimension")
-        elif len(reported_dimensions) > 1:
+        elif (
+            dimension is not None
+            and adapter_dimension is not None
+            and dimension != adapter_dimension
+        ):
             raise MismatchedDimension(
                 "Dimensions reported by adapter, dimension, and collection do not match"
             )
@@ -181,6 +243,25 @@ class Collection:
                 stmt = select(func.count()).select_from(self.table)
                 return sess.execute(stmt).scalar() or 0
 
+    def _create_table_sql(self) -> str:
+        """
+        PRIVATE
+
+        Renders the `create table if not exists` statement for the collection's table,
+        escaped for the client's database driver so it can be combined with other
+        statements and executed with `exec_driver_sql`.
+
+        Returns:
+            str: The DDL statement.
+        """
+        from sqlalchemy.schema import CreateTable
+
+        return str(
+            CreateTable(self.table, if_not_exists=True).compile(
+                dialect=self.client.engine.dialect
+            )
+        )
+
     def _create_if_not_exists(self):
         """
         PRIVATE
@@ -190,42 +271,33 @@ class Collection:
         Returns:
             Collection: The found or created collection.
         """
-        query = text(
-            f"""
-        select
-            relname as table_name,
-            atttypmod as embedding_dim
-        from
-            pg_class pc
-            join pg_attribute pa
-                on pc.oid = pa.attrelid
-        where
-            pc.relnamespace = 'vecs'::regnamespace
-            and pc.relkind = 'r'
-            and pa.attname = 'vec'
-            and not pc.relname ^@ '_'
-            and pc.relname = :name
-        """
-        ).bindparams(name=self.name)
-        with self.client.Session() as sess:
-            query_result = sess.execute(query).fetchone()
-
-            if query_result:
-                _, collection_dimension = query_result
-            else:
-                collection_dimension = None
-
-        reported_dimensions = set(
-            [x for x in [self.dimension, collection_dimension] if x is not None]
-        )
-        if len(reported_dimensions) > 1:
+        lookup = self.client._collection_lookup_sql
+        with self.client.engine.begin() as conn:
+            # Look the collection up first so resolving an existing collection only
+            # needs catalog reads, not create privileges on the schema
+            collection_dimension = conn.execute(
+                lookup, {"name": self.name}
+            ).scalar_one_or_none()
+
+            if collection_dimension is None:
+                # Create the table and report the dimension of the table that now exists,
+                # in case another process created it first, in a single round trip.
+                # The result is that of the final statement
+                compiled_lookup = lookup.compile(dialect=self.client.engine.dialect)
+                collection_dimension = conn.exec_driver_sql(
+                    f"{self._create_table_sql()};{compiled_lookup}",
+                    {"name": self.name},
+                ).scalar_one_or_none()
+
+        if (
+            self.dimension is not None
+            and collection_dimension is not None
+            and self.dimension != collection_dimension
+        ):
             raise MismatchedDimension(
                 "Dimensions reported by adapter, dimension, and existing collection do not match"
             )
 
-        if not collection_dimension:
-            self.table.create(self.client.engine)
-
         return self
 
     def _create(self):
@@ -261,24 +333,6 @@ class Collection:
             )
         return self
 
-    def _drop(self):
-        """
-        PRIVATE
-
-        Deletes the collection from the database. Raises a `vecs.exc.CollectionNotFound`
-        exception if no collection with the specified name exists.
-
-        Returns:
-            Collection: The deleted collection.
-        """
-        from sqlalchemy.schema import DropTable
-
-        with self.client.Session() as sess:
-            sess.execute(DropTable(self.table, if_exists=True))
-            sess.commit()
-
-        return self
-
     def upsert(
         self, records: Iterable[Tuple[str, Any, Metadata]], skip_adapter: bool = False
     ) -> None:
@@ -516,28 +570,10 @@ class Collection:
             List[Collection]: A list of all existing collections.
         """
 
-        query = text(
-            """
-        select
-            relname as table_name,
-            atttypmod as embedding_dim
-        from
-            pg_class pc
-            join pg_attribute pa
-                on pc.oid = pa.attrelid
-        where
-            pc.relnamespace = 'vecs'::regnamespace
-            and pc.relkind = 'r'
-            and pa.attname = 'vec'
-            and not pc.relname ^@ '_'
-        """
-        )
-        xc = []
-        with client.Session() as sess:
-            for name, dimension in sess.execute(query):
-                existing_collection = cls(name, dimension, client)
-                xc.append(existing_collection)
-        return xc
+        # Fetch every (name, dimension) pair in one query and build the collections locally
+        with client.engine.connect() as conn:
+            rows = conn.execute(_LIST_COLLECTIONS_SQL).all()
+        return [cls(name, dimension, client) for name, dimension in rows]
 
     @classmethod
     def _does_collection_exist(cls, client: "Client", name: str) -> bool:
@@ -837,3 +873,21 @@ def build_table(name: str, meta: MetaData, dimension: int) -> Table:
         ),
         extend_existing=True,
     )
+
+
+def build_drop_table(name: str) -> DropTable:
+    """
+    PRIVATE
+
+    Builds the statement that drops the table underpinning a `vecs.Collection`, if it exists.
+
+    A bare table is enough for SQLAlchemy to quote and escape the name, so the collection's
+    full model doesn't need to be built.
+
+    Args:
+        name (str): The name of the table.
+
+    Returns:
+        DropTable: The drop table statement.
+    """
+    return DropTable(Table(name, MetaData(schema="vecs")), if_exists=True)